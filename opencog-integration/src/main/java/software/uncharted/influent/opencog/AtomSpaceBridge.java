@@ -133,6 +133,61 @@ public class AtomSpaceBridge {
     }
   }
 
+  /**
+   * Add a batch of transaction entities to the AtomSpace in a single bridge call
+   *
+   * @param entities maps with {@code entity_id} and {@code properties} keys
+   * @return atom ids in input order
+   */
+  public List<String> addTransactionEntities(List<Map<String, Object>> entities) {
+    try {
+      Map<String, Object> params = new HashMap<>();
+      params.put("entities", entities);
+
+      String resultJson = pythonBridge.executeWithResult("add_transaction_entities", params);
+
+      @SuppressWarnings("unchecked")
+      List<String> atomIds = objectMapper.readValue(resultJson, List.class);
+
+      for (int i = 0; i < atomIds.size(); i++) {
+        atomCache.put("entity_" + entities.get(i).get("entity_id"), atomIds.get(i));
+      }
+
+      logger.debug("Added {} transaction entities to AtomSpace", atomIds.size());
+      return atomIds;
+
+    } catch (Exception e) {
+      logger.error("Failed to add transaction entities", e);
+      throw new RuntimeException("Failed to add transaction entities", e);
+    }
+  }
+
+  /**
+   * Create a batch of relationships in the AtomSpace in a single bridge call
+   *
+   * @param relationships maps with {@code predicate}, {@code from_entity}, {@code to_entity} and
+   *     {@code strength} keys
+   * @return link ids in input order
+   */
+  public List<String> createRelationships(List<Map<String, Object>> relationships) {
+    try {
+      Map<String, Object> params = new HashMap<>();
+      params.put("edges", relationships);
+
+      String resultJson = pythonBridge.executeWithResult("create_relationships", params);
+
+      @SuppressWarnings("unchecked")
+      List<String> linkIds = objectMapper.readValue(resultJson, List.class);
+
+      logger.debug("Created {} relationships", linkIds.size());
+      return linkIds;
+
+    } catch (Exception e) {
+      logger.error("Failed to create relationships", e);
+      throw new RuntimeException("Failed to create relationships", e);
+    }
+  }
+
   /** Execute pattern matching to find cognitive patterns in the transaction data */
   public List<Map<String, Object>> executePatternMatching(String pattern) {
     try {
@@ -21,6 +21,9 @@ public class CognitiveDataFlowAnalyzer {
 
   private static final Logger logger = LoggerFactory.getLogger(CognitiveDataFlowAnalyzer.class);
 
+  /** Maximum number of entities or relationships sent to the AtomSpace in one call */
+  private static final int INGEST_BATCH_SIZE = 1000;
+
   private final AtomSpaceBridge atomSpaceBridge;
   private final Map<String, CognitiveInsight> entityInsights;
   private final Map<String, List<String>> entityRelationships;
@@ -84,20 +87,58 @@ public class CognitiveDataFlowAnalyzer {
   private void ingestEntities(List<TransactionEntity> entities) {
     logger.debug("Ingesting {} entities into AtomSpace", entities.size());
 
-    for (TransactionEntity entity : entities) {
+    for (int start = 0; start < entities.size(); start += INGEST_BATCH_SIZE) {
+      List<TransactionEntity> chunk =
+          entities.subList(start, Math.min(start + INGEST_BATCH_SIZE, entities.size()));
+
+      List<Map<String, Object>> batch = new ArrayList<>(chunk.size());
+      for (TransactionEntity entity : chunk) {
+        batch.add(entity(entity.getId(), buildEntityProperties(entity)));
+      }
+
       try {
-        Map<String, Object> properties = buildEntityProperties(entity);
-        String atomId = atomSpaceBridge.addTransactionEntity(entity.getId(), properties);
+        List<String> atomIds = atomSpaceBridge.addTransactionEntities(batch);
 
         // Store for later reference
-        entityInsights.put(entity.getId(), new CognitiveInsight(entity.getId(), atomId));
+        for (int i = 0; i < chunk.size(); i++) {
+          String entityId = chunk.get(i).getId();
+          entityInsights.put(entityId, new CognitiveInsight(entityId, atomIds.get(i)));
+        }
+
+      } catch (Exception e) {
+        logger.warn(
+            "Failed to ingest batch of {} entities, retrying individually: {}",
+            batch.size(),
+            e.getMessage());
+        ingestEntitiesIndividually(batch);
+      }
+    }
+  }
 
+  /** Ingest entities one call at a time so a bad entity does not fail its whole batch */
+  @SuppressWarnings("unchecked")
+  private void ingestEntitiesIndividually(List<Map<String, Object>> batch) {
+    for (Map<String, Object> entity : batch) {
+      String entityId = (String) entity.get("entity_id");
+      try {
+        String atomId =
+            atomSpaceBridge.addTransactionEntity(
+                entityId, (Map<String, Object>) entity.get("properties"));
+        entityInsights.put(entityId, new CognitiveInsight(entityId, atomId));
       } catch (Exception e) {
-        logger.warn("Failed to ingest entity {}: {}", entity.getId(), e.getMessage());
+        logger.warn("Failed to ingest entity {}: {}", entityId, e.getMessage());
       }
     }
   }
 
+  /** Build an entity entry for a batched AtomSpace call */
+  private Map<String, Object> entity(String entityId, Map<String, Object> properties) {
+    Map<String, Object> entity = new HashMap<>();
+    entity.put("entity_id", entityId);
+    entity.put("properties", properties);
+    return entity;
+  }
+
   /** Build properties map for an entity */
   private Map<String, Object> buildEntityProperties(TransactionEntity entity) {
     Map<String, Object> properties = new HashMap<>();
@@ -127,6 +168,8 @@ public class CognitiveDataFlowAnalyzer {
   private void mapRelationships(List<Transaction> transactions) {
     logger.debug("Mapping relationships from {} transactions", transactions.size());
 
+    List<Map<String, Object>> relationships = new ArrayList<>();
+
     for (Transaction transaction : transactions) {
       try {
         String fromEntity = transaction.getFromEntity();
@@ -136,15 +179,15 @@ public class CognitiveDataFlowAnalyzer {
         // Calculate relationship strength based on amount and frequency
         double strength = calculateRelationshipStrength(fromEntity, toEntity, amount);
 
-        // Create relationship in AtomSpace
-        atomSpaceBridge.createRelationship("transacts_with", fromEntity, toEntity, strength);
+        // Queue relationship for the AtomSpace
+        relationships.add(relationship("transacts_with", fromEntity, toEntity, strength));
 
         // Track relationships
         entityRelationships.computeIfAbsent(fromEntity, k -> new ArrayList<>()).add(toEntity);
 
         // Create temporal relationship if timing is significant
         if (isTemporallySignificant(transaction)) {
-          atomSpaceBridge.createRelationship("temporal_sequence", fromEntity, toEntity, 0.7);
+          relationships.add(relationship("temporal_sequence", fromEntity, toEntity, 0.7));
         }
 
       } catch (Exception e) {
@@ -154,6 +197,53 @@ public class CognitiveDataFlowAnalyzer {
             e.getMessage());
       }
     }
+
+    for (int start = 0; start < relationships.size(); start += INGEST_BATCH_SIZE) {
+      List<Map<String, Object>> chunk =
+          relationships.subList(start, Math.min(start + INGEST_BATCH_SIZE, relationships.size()));
+
+      try {
+        atomSpaceBridge.createRelationships(chunk);
+
+      } catch (Exception e) {
+        logger.warn(
+            "Failed to create batch of {} relationships, retrying individually: {}",
+            chunk.size(),
+            e.getMessage());
+        createRelationshipsIndividually(chunk);
+      }
+    }
+  }
+
+  /** Create relationships one call at a time so a bad edge does not fail its whole batch */
+  private void createRelationshipsIndividually(List<Map<String, Object>> relationships) {
+    for (Map<String, Object> relationship : relationships) {
+      try {
+        atomSpaceBridge.createRelationship(
+            (String) relationship.get("predicate"),
+            (String) relationship.get("from_entity"),
+            (String) relationship.get("to_entity"),
+            (Double) relationship.get("strength"));
+      } catch (Exception e) {
+        logger.warn(
+            "Failed to create relationship {} from {} to {}: {}",
+            relationship.get("predicate"),
+            relationship.get("from_entity"),
+            relationship.get("to_entity"),
+            e.getMessage());
+      }
+    }
+  }
+
+  /** Build a relationship entry for a batched AtomSpace call */
+  private Map<String, Object> relationship(
+      String predicate, String fromEntity, String toEntity, double strength) {
+    Map<String, Object> relationship = new HashMap<>();
+    relationship.put("predicate", predicate);
+    relationship.put("from_entity", fromEntity);
+    relationship.put("to_entity", toEntity);
+    relationship.put("strength", strength);
+    return relationship;
   }
 
   /** Calculate relationship strength between entities */
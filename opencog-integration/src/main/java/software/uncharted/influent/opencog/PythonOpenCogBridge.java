@@ -2,8 +2,14 @@ package software.uncharted.influent.opencog;
 
 import com.fasterxml.jackson.databind.ObjectMapper;
 import java.io.*;
+import java.nio.charset.StandardCharsets;
 import java.util.*;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
 import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
 import org.apache.commons.exec.*;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
@@ -12,7 +18,9 @@ import org.slf4j.LoggerFactory;
  * Bridge class for executing OpenCog Python scripts from Java.
  *
  * <p>This class manages the communication between the Java-based Influent system and Python-based
- * OpenCog cognitive computing components.
+ * OpenCog cognitive computing components. A single long-lived Python process is started on first
+ * use and exchanges newline-delimited JSON frames over stdin/stdout, so the AtomSpace stays
+ * resident across calls.
  */
 public class PythonOpenCogBridge {
 
@@ -21,11 +29,25 @@ public class PythonOpenCogBridge {
   private final ObjectMapper objectMapper;
   private final String pythonScriptPath;
   private final long timeoutSeconds;
+  private final ExecutorService responseReader;
+
+  private Process daemon;
+  private BufferedWriter daemonInput;
+  private BufferedReader daemonOutput;
+  private long nextRequestId;
+  private boolean daemonStarted;
 
   public PythonOpenCogBridge() {
     this.objectMapper = new ObjectMapper();
     this.pythonScriptPath = determinePythonScriptPath();
     this.timeoutSeconds = 60; // Default timeout
+    this.responseReader =
+        Executors.newSingleThreadExecutor(
+            r -> {
+              Thread thread = new Thread(r, "opencog-bridge-reader");
+              thread.setDaemon(true);
+              return thread;
+            });
 
     validatePythonEnvironment();
   }
@@ -101,70 +123,149 @@ public class PythonOpenCogBridge {
   }
 
   /** Internal method to execute Python functions */
-  private String executeInternal(
+  private synchronized String executeInternal(
       String functionName, Map<String, Object> parameters, boolean returnResult)
       throws IOException {
 
-    // Create command to execute Python script
-    CommandLine cmdLine = new CommandLine("python3");
-
-    // Add the bridge script
-    String scriptPath = pythonScriptPath + "opencog_bridge.py";
-    cmdLine.addArgument(scriptPath);
-    cmdLine.addArgument(functionName);
+    ensureDaemonRunning();
 
-    // Convert parameters to JSON
-    String parametersJson = objectMapper.writeValueAsString(parameters);
-    cmdLine.addArgument(parametersJson, false); // Don't handle quoting automatically
+    // Build the request frame
+    long requestId = nextRequestId++;
+    Map<String, Object> request = new LinkedHashMap<>();
+    request.put("id", requestId);
+    request.put("fn", functionName);
+    request.put("args", parameters);
 
-    // Set up executor
-    DefaultExecutor executor = new DefaultExecutor();
-    executor.setExitValue(0);
+    logger.debug("Executing Python function: {} with parameters: {}", functionName, parameters);
 
-    // Set timeout
-    ExecuteWatchdog watchdog = new ExecuteWatchdog(TimeUnit.SECONDS.toMillis(timeoutSeconds));
-    executor.setWatchdog(watchdog);
+    daemonInput.write(objectMapper.writeValueAsString(request));
+    daemonInput.newLine();
+    daemonInput.flush();
 
-    // Capture output
-    ByteArrayOutputStream outputStream = new ByteArrayOutputStream();
-    ByteArrayOutputStream errorStream = new ByteArrayOutputStream();
-    PumpStreamHandler streamHandler = new PumpStreamHandler(outputStream, errorStream);
-    executor.setStreamHandler(streamHandler);
+    String line = readResponseLine();
 
+    Map<String, Object> response;
     try {
-      logger.debug("Executing Python function: {} with parameters: {}", functionName, parameters);
+      @SuppressWarnings("unchecked")
+      Map<String, Object> frame = objectMapper.readValue(line, Map.class);
+      response = frame;
+    } catch (IOException e) {
+      // The pipe is out of step with our requests; restart rather than misread the next call
+      stopDaemon();
+      throw new IOException("Malformed Python bridge response: " + line, e);
+    }
 
-      int exitCode = executor.execute(cmdLine);
+    Object responseId = response.get("id");
+    if (!(responseId instanceof Number) || ((Number) responseId).longValue() != requestId) {
+      stopDaemon();
+      throw new IOException(
+          "Python bridge response id " + responseId + " does not match request " + requestId);
+    }
 
-      String output = outputStream.toString().trim();
-      String errorOutput = errorStream.toString().trim();
+    if (response.containsKey("error")) {
+      String error = String.valueOf(response.get("error"));
+      logger.error("Python function {} failed: {}", functionName, error);
+      throw new IOException("Python script execution failed: " + error);
+    }
 
-      if (!errorOutput.isEmpty()) {
-        logger.warn("Python script stderr: {}", errorOutput);
-      }
+    if (!returnResult) {
+      logger.debug("Python function {} executed successfully", functionName);
+      return null;
+    }
+
+    Object result = response.get("result");
+    String output;
+    if (result == null) {
+      output = "";
+    } else if (result instanceof String) {
+      output = (String) result;
+    } else {
+      output = objectMapper.writeValueAsString(result);
+    }
+
+    logger.debug("Python function {} returned: {}", functionName, output);
+    return output;
+  }
+
+  /** Start the persistent Python daemon if it is not already running */
+  private void ensureDaemonRunning() throws IOException {
+    if (daemon != null && daemon.isAlive()) {
+      return;
+    }
+
+    if (daemonStarted) {
+      stopDaemon();
+      logger.warn(
+          "Restarting Python OpenCog bridge daemon; AtomSpace state from the previous daemon is"
+              + " lost and previously returned atom ids are stale");
+    }
+
+    String scriptPath = pythonScriptPath + "opencog_bridge.py";
+    ProcessBuilder builder = new ProcessBuilder("python3", scriptPath, "--serve");
+    builder.redirectError(ProcessBuilder.Redirect.INHERIT);
+
+    logger.info("Starting Python OpenCog bridge daemon: {}", scriptPath);
+    daemon = builder.start();
+    daemonStarted = true;
+    daemonInput =
+        new BufferedWriter(
+            new OutputStreamWriter(daemon.getOutputStream(), StandardCharsets.UTF_8));
+    daemonOutput =
+        new BufferedReader(new InputStreamReader(daemon.getInputStream(), StandardCharsets.UTF_8));
+  }
 
-      if (returnResult) {
-        logger.debug("Python function {} returned: {}", functionName, output);
-        return output;
-      } else {
-        logger.debug("Python function {} executed successfully", functionName);
-        return null;
+  /** Read a single response line from the daemon, honouring the configured timeout */
+  private String readResponseLine() throws IOException {
+    Future<String> pending = responseReader.submit(daemonOutput::readLine);
+    try {
+      String line = pending.get(timeoutSeconds, TimeUnit.SECONDS);
+      if (line == null) {
+        stopDaemon();
+        throw new IOException("Python bridge daemon exited unexpectedly");
       }
+      return line;
+
+    } catch (TimeoutException e) {
+      pending.cancel(true);
+      stopDaemon();
+      logger.error("Python script execution timed out after {} seconds", timeoutSeconds);
+      throw new IOException("Python script execution timed out", e);
+
+    } catch (InterruptedException e) {
+      Thread.currentThread().interrupt();
+      stopDaemon();
+      throw new IOException("Interrupted while waiting for Python bridge", e);
+
+    } catch (ExecutionException e) {
+      stopDaemon();
+      throw new IOException("Failed to read from Python bridge", e.getCause());
+    }
+  }
 
-    } catch (ExecuteException e) {
-      String errorOutput = errorStream.toString();
-      logger.error(
-          "Python script execution failed with exit code {}: {}", e.getExitValue(), errorOutput);
-      throw new IOException("Python script execution failed: " + errorOutput, e);
+  /** Terminate the daemon process, if any */
+  private synchronized void stopDaemon() {
+    if (daemon == null) {
+      return;
+    }
 
+    try {
+      daemonInput.close();
     } catch (IOException e) {
-      if (watchdog.killedProcess()) {
-        logger.error("Python script execution timed out after {} seconds", timeoutSeconds);
-        throw new IOException("Python script execution timed out", e);
-      } else {
-        throw e;
+      logger.debug("Error closing Python bridge input: {}", e.getMessage());
+    }
+
+    try {
+      if (!daemon.waitFor(5, TimeUnit.SECONDS)) {
+        daemon.destroyForcibly();
       }
+    } catch (InterruptedException e) {
+      Thread.currentThread().interrupt();
+      daemon.destroyForcibly();
     }
+
+    daemon = null;
+    daemonInput = null;
+    daemonOutput = null;
   }
 
   /** Test the Python bridge connection */
@@ -191,13 +292,25 @@ public class PythonOpenCogBridge {
   }
 
   /** Shutdown the Python bridge */
-  public void shutdown() {
+  public synchronized void shutdown() {
+    // A deliberate shutdown discards the AtomSpace, so a later restart is not a loss
+    daemonStarted = false;
+
+    if (daemon == null || !daemon.isAlive()) {
+      // Nothing is running; do not start a daemon only to shut it down
+      stopDaemon();
+      return;
+    }
+
     try {
       execute("shutdown");
       logger.info("Python bridge shutdown completed");
 
     } catch (Exception e) {
       logger.warn("Error during Python bridge shutdown: {}", e.getMessage());
+
+    } finally {
+      stopDaemon();
     }
   }
 }
@@ -8,9 +8,35 @@ reasoning capabilities for the Influent transaction flow analysis system.
 
 import sys
 import json
+import itertools
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import traceback
+from collections import OrderedDict
+
+# Prefer orjson for the bridge's JSON frames, falling back to the stdlib
+try:
+    import orjson
+    
+    _dumpb = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumpb(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
+# NumPy vectorises the numeric scans on the OpenCog path and Numba compiles them;
+# both are optional and the scans fall back to plain Python without them
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,6 +46,25 @@ logger = logging.getLogger(__name__)
 atomspace = None
 opencog_available = False
 
+# Maximum number of matching handles returned by execute_pattern_matching
+MAX_PATTERN_MATCHES = 10
+
+# Maximum number of nodes kept in _node_cache before the least recently used is evicted
+NODE_CACHE_SIZE = 10000
+
+# Nodes already added to the AtomSpace, keyed by (type name, node name), in LRU order
+_node_cache: Dict[Tuple[str, str], Any] = OrderedDict()
+
+# Behavior predicates of the relationships touching each entity, as ordered sets
+_behavior_index: Dict[str, Dict[str, None]] = {}
+
+# Maximum number of pattern matcher queries kept in _pattern_cache
+PATTERN_CACHE_SIZE = 256
+
+# Pattern matcher queries built by execute_pattern_matching, keyed by pattern, in LRU
+# order. An evicted query's atoms stay in the AtomSpace and are reused if it is rebuilt.
+_pattern_cache: Dict[str, Any] = OrderedDict()
+
 def initialize_opencog():
     """Initialize OpenCog components and check availability."""
     global atomspace, opencog_available
@@ -37,6 +82,7 @@ def initialize_opencog():
         initialize_opencog(atomspace)
         
         opencog_available = True
+        _bind_implementations(True)
         logger.info("OpenCog successfully initialized")
         
         return True
@@ -44,10 +90,12 @@ def initialize_opencog():
     except ImportError as e:
         logger.warning(f"OpenCog not available, using mock implementation: {e}")
         opencog_available = False
+        _bind_implementations(False)
         return False
     except Exception as e:
         logger.error(f"Failed to initialize OpenCog: {e}")
         opencog_available = False
+        _bind_implementations(False)
         return False
 
 
@@ -55,10 +103,6 @@ def initialize_atomspace():
     """Initialize the AtomSpace for transaction flow analytics."""
     global atomspace
     
-    if not opencog_available:
-        logger.info("Using mock AtomSpace initialization")
-        return "mock_atomspace_id"
-    
     try:
         # Initialize basic cognitive architecture
         logger.info("Initializing AtomSpace for transaction flow analytics")
@@ -77,16 +121,12 @@ def create_concept_node(concept: str) -> str:
     """Create a concept node in the AtomSpace."""
     global atomspace
     
-    if not opencog_available:
-        return f"mock_concept_{concept}"
-    
     try:
         import opencog.type_constructors as tc
         
-        node = tc.ConceptNode(concept)
-        atomspace.add_atom(node)
+        node = _node(tc, "ConceptNode", concept)
         
-        logger.debug(f"Created concept node: {concept}")
+        logger.debug("Created concept node: %s", concept)
         return str(node.h)
         
     except Exception as e:
@@ -98,16 +138,12 @@ def create_predicate_node(predicate: str) -> str:
     """Create a predicate node in the AtomSpace."""
     global atomspace
     
-    if not opencog_available:
-        return f"mock_predicate_{predicate}"
-    
     try:
         import opencog.type_constructors as tc
         
-        node = tc.PredicateNode(predicate)
-        atomspace.add_atom(node)
+        node = _node(tc, "PredicateNode", predicate)
         
-        logger.debug(f"Created predicate node: {predicate}")
+        logger.debug("Created predicate node: %s", predicate)
         return str(node.h)
         
     except Exception as e:
@@ -115,32 +151,54 @@ def create_predicate_node(predicate: str) -> str:
         raise
 
 
+def _lru_get(cache, key, build, max_size: int):
+    """Return ``cache[key]``, building it with ``build()`` and evicting the least
+    recently used entry once ``cache`` holds more than ``max_size`` entries."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+        return value
+    
+    value = cache[key] = build()
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+    return value
+
+
+def _node(tc, type_name: str, name: str):
+    """Return the ``type_name`` node called ``name``, reusing recently created ones."""
+    return _lru_get(
+        _node_cache, (type_name, name), lambda: getattr(tc, type_name)(name), NODE_CACHE_SIZE
+    )
+
+
+def _index_behavior(predicate: str, from_entity: str, to_entity: str) -> None:
+    """Record a behavior predicate against both endpoints of a relationship."""
+    if "behavior" in predicate.lower():
+        _behavior_index.setdefault(from_entity, {})[predicate] = None
+        _behavior_index.setdefault(to_entity, {})[predicate] = None
+
+
 def add_transaction_entity(entity_id: str, properties: Dict[str, Any]) -> str:
     """Add a transaction entity with properties to the AtomSpace."""
     global atomspace
     
-    if not opencog_available:
-        return f"mock_entity_{entity_id}"
-    
     try:
         import opencog.type_constructors as tc
         
+        EvaluationLink, ListLink = tc.EvaluationLink, tc.ListLink
+        
         # Create entity node
         entity_node = tc.ConceptNode(f"entity_{entity_id}")
-        atomspace.add_atom(entity_node)
         
         # Add properties as evaluation links
         for prop_name, prop_value in properties.items():
-            pred_node = tc.PredicateNode(f"has_{prop_name}")
-            value_node = tc.ConceptNode(str(prop_value))
-            
-            eval_link = tc.EvaluationLink(
-                pred_node,
-                tc.ListLink(entity_node, value_node)
+            EvaluationLink(
+                _node(tc, "PredicateNode", f"has_{prop_name}"),
+                ListLink(entity_node, _node(tc, "ConceptNode", str(prop_value)))
             )
-            atomspace.add_atom(eval_link)
         
-        logger.debug(f"Added transaction entity: {entity_id} with {len(properties)} properties")
+        logger.debug("Added transaction entity: %s with %d properties", entity_id, len(properties))
         return str(entity_node.h)
         
     except Exception as e:
@@ -152,17 +210,14 @@ def create_relationship(predicate: str, from_entity: str, to_entity: str, streng
     """Create a relationship between two entities in the AtomSpace."""
     global atomspace
     
-    if not opencog_available:
-        return f"mock_relationship_{predicate}_{from_entity}_{to_entity}"
-    
     try:
         import opencog.type_constructors as tc
         from opencog.atomspace import TruthValue
         
         # Create entity nodes
-        from_node = tc.ConceptNode(from_entity)
-        to_node = tc.ConceptNode(to_entity)
-        pred_node = tc.PredicateNode(predicate)
+        from_node = _node(tc, "ConceptNode", from_entity)
+        to_node = _node(tc, "ConceptNode", to_entity)
+        pred_node = _node(tc, "PredicateNode", predicate)
         
         # Create evaluation link with strength
         eval_link = tc.EvaluationLink(
@@ -172,9 +227,11 @@ def create_relationship(predicate: str, from_entity: str, to_entity: str, streng
         
         # Set truth value (strength and confidence)
         eval_link.tv = TruthValue(strength, 0.9)
-        atomspace.add_atom(eval_link)
         
-        logger.debug(f"Created relationship: {predicate} between {from_entity} and {to_entity} with strength {strength}")
+        _index_behavior(predicate, from_entity, to_entity)
+        
+        logger.debug("Created relationship: %s between %s and %s with strength %s",
+                     predicate, from_entity, to_entity, strength)
         return str(eval_link.h)
         
     except Exception as e:
@@ -182,48 +239,165 @@ def create_relationship(predicate: str, from_entity: str, to_entity: str, streng
         raise
 
 
-def execute_pattern_matching(pattern: str) -> List[Dict[str, Any]]:
-    """Execute pattern matching to find cognitive patterns in the transaction data."""
+def add_transaction_entities(entities: List[Dict[str, Any]]) -> List[str]:
+    """Add a batch of transaction entities to the AtomSpace in a single call.
+    
+    Each entry carries ``entity_id`` and ``properties`` as for
+    ``add_transaction_entity``. Returns the entity handles in input order.
+    """
     global atomspace
     
-    if not opencog_available:
-        # Return mock results
-        return [
-            {
-                "pattern": pattern,
-                "matches": ["mock_match_1", "mock_match_2"],
-                "confidence": 0.85
-            }
-        ]
+    try:
+        import opencog.type_constructors as tc
+        
+        # Resolve constructors once for the whole batch
+        ConceptNode, EvaluationLink, ListLink = tc.ConceptNode, tc.EvaluationLink, tc.ListLink
+        
+        handles = []
+        append_handle = handles.append
+        for entity in entities:
+            entity_id = entity["entity_id"]
+            properties = entity["properties"]
+            entity_node = ConceptNode(f"entity_{entity_id}")
+            
+            for prop_name, prop_value in properties.items():
+                EvaluationLink(
+                    _node(tc, "PredicateNode", f"has_{prop_name}"),
+                    ListLink(entity_node, _node(tc, "ConceptNode", str(prop_value)))
+                )
+            
+            append_handle(str(entity_node.h))
+        
+        logger.debug("Added %d transaction entities", len(handles))
+        return handles
+        
+    except Exception as e:
+        logger.error(f"Failed to add transaction entities: {e}")
+        raise
+
+
+def create_relationships(edges: List[Dict[str, Any]]) -> List[str]:
+    """Create a batch of relationships in the AtomSpace in a single call.
+    
+    Each entry carries ``predicate``, ``from_entity``, ``to_entity`` and
+    ``strength`` as for ``create_relationship``. Returns the link handles in
+    input order.
+    """
+    global atomspace
     
     try:
-        from opencog.bindlink import execute_atom
-        from opencog.atomspace import types
         import opencog.type_constructors as tc
+        from opencog.atomspace import TruthValue
         
-        # This is a simplified pattern matching - in practice, you would
-        # create more sophisticated pattern matching based on the specific pattern
+        # Resolve constructors once for the whole batch
+        EvaluationLink, ListLink = tc.EvaluationLink, tc.ListLink
+        
+        handles = []
+        append_handle = handles.append
+        for edge in edges:
+            predicate = edge["predicate"]
+            from_entity = edge["from_entity"]
+            to_entity = edge["to_entity"]
+            
+            eval_link = EvaluationLink(
+                _node(tc, "PredicateNode", predicate),
+                ListLink(_node(tc, "ConceptNode", from_entity), _node(tc, "ConceptNode", to_entity))
+            )
+            eval_link.tv = TruthValue(edge["strength"], 0.9)
+            
+            _index_behavior(predicate, from_entity, to_entity)
+            
+            append_handle(str(eval_link.h))
+        
+        logger.debug("Created %d relationships", len(handles))
+        return handles
+        
+    except Exception as e:
+        logger.error(f"Failed to create relationships: {e}")
+        raise
+
+
+def _build_get_link(pattern: str):
+    """Build a GetLink grounding the ConceptNode pairs related by ``pattern``."""
+    import opencog.type_constructors as tc
+    
+    return tc.GetLink(
+        tc.VariableList(
+            tc.TypedVariableLink(tc.VariableNode("$x"), tc.TypeNode("ConceptNode")),
+            tc.TypedVariableLink(tc.VariableNode("$y"), tc.TypeNode("ConceptNode"))
+        ),
+        tc.EvaluationLink(
+            tc.PredicateNode(pattern),
+            tc.ListLink(tc.VariableNode("$x"), tc.VariableNode("$y"))
+        )
+    )
+
+
+def _iter_name_matches(atoms, pattern_lower: str):
+    """Yield handles of the atoms whose name contains ``pattern_lower``."""
+    for atom in atoms:
+        if pattern_lower in atom.name.lower():
+            yield str(atom.h)
+
+
+def _iter_grounded_entities(groundings):
+    """Yield the handles of the entities in ``groundings`` once each, in order."""
+    seen = set()
+    for grounding in groundings:
+        for entity in grounding.out:
+            handle = str(entity.h)
+            if handle not in seen:
+                seen.add(handle)
+                yield handle
+
+
+def execute_pattern_matching(pattern: str, count: bool = False) -> List[Dict[str, Any]]:
+    """Execute pattern matching to find cognitive patterns in the transaction data.
+    
+    At most ``MAX_PATTERN_MATCHES`` handles are returned. The scan stops once
+    that many are found unless ``count`` asks for the total number of matches.
+    """
+    global atomspace
+    
+    try:
+        from opencog.bindlink import execute_atom
+        from opencog.atomspace import types
         
-        # For now, return basic pattern matching results
         results = []
         
-        # Query atoms matching the pattern
-        atoms = atomspace.get_atoms_by_type(types.Atom)
+        # Treat the pattern as a predicate name and let the pattern matcher
+        # find the entities it relates, using the AtomSpace indices
+        query = _lru_get(
+            _pattern_cache, pattern, lambda: _build_get_link(pattern), PATTERN_CACHE_SIZE
+        )
+        groundings = execute_atom(atomspace, query).out
         
-        matching_atoms = []
-        for atom in atoms:
-            if pattern.lower() in str(atom).lower():
-                matching_atoms.append(str(atom.h))
+        if groundings:
+            # Both ends of each relationship, without repeating fan-out sources
+            matches = _iter_grounded_entities(groundings)
+        else:
+            # Fall back to matching entity names when the pattern is not a
+            # predicate. Only ConceptNodes are scanned so the query's own
+            # PredicateNode and VariableNodes never match themselves.
+            atoms = atomspace.get_atoms_by_type(types.ConceptNode)
+            matches = _iter_name_matches(atoms, pattern.lower())
+        
+        if count:
+            matching_atoms = list(matches)
+        else:
+            matching_atoms = list(itertools.islice(matches, MAX_PATTERN_MATCHES))
         
         if matching_atoms:
-            results.append({
+            result = {
                 "pattern": pattern,
-                "matches": matching_atoms[:10],  # Limit to first 10 matches
-                "confidence": 0.8,
-                "count": len(matching_atoms)
-            })
+                "matches": matching_atoms[:MAX_PATTERN_MATCHES],
+                "confidence": 0.8
+            }
+            if count:
+                result["count"] = len(matching_atoms)
+            results.append(result)
         
-        logger.debug(f"Pattern matching for '{pattern}' found {len(matching_atoms)} matches")
+        logger.debug("Pattern matching for '%s' found %d matches", pattern, len(matching_atoms))
         return results
         
     except Exception as e:
@@ -235,17 +409,6 @@ def run_pln_inference(query: str, max_steps: int) -> List[Dict[str, Any]]:
     """Run PLN (Probabilistic Logic Networks) inference for cognitive reasoning."""
     global atomspace
     
-    if not opencog_available:
-        # Return mock PLN results
-        return [
-            {
-                "query": query,
-                "inference_result": "mock_inference_result",
-                "confidence": 0.75,
-                "steps": min(max_steps, 5)
-            }
-        ]
-    
     try:
         # PLN inference implementation would go here
         # This is a placeholder for actual PLN reasoning
@@ -261,7 +424,7 @@ def run_pln_inference(query: str, max_steps: int) -> List[Dict[str, Any]]:
             "reasoning_path": ["step1", "step2", "conclusion"]
         })
         
-        logger.debug(f"PLN inference for query '{query}' completed in {min(max_steps, 3)} steps")
+        logger.debug("PLN inference for query '%s' completed in %d steps", query, min(max_steps, 3))
         return results
         
     except Exception as e:
@@ -269,40 +432,52 @@ def run_pln_inference(query: str, max_steps: int) -> List[Dict[str, Any]]:
         raise
 
 
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _indices_above(values, threshold):
+        """Return the indices of ``values`` strictly greater than ``threshold``."""
+        mask = np.empty(values.shape[0], dtype=np.bool_)
+        for i in prange(values.shape[0]):
+            mask[i] = values[i] > threshold
+        return np.flatnonzero(mask)
+elif np is not None:
+    def _indices_above(values, threshold):
+        """Return the indices of ``values`` strictly greater than ``threshold``."""
+        return np.flatnonzero(values > threshold)
+else:
+    def _indices_above(values, threshold):
+        """Return the indices of ``values`` strictly greater than ``threshold``."""
+        return [i for i, value in enumerate(values) if value > threshold]
+
+
 def detect_anomalies(threshold: float) -> List[Dict[str, Any]]:
     """Detect anomalies using OpenCog's attention allocation mechanisms."""
     global atomspace
     
-    if not opencog_available:
-        # Return mock anomalies
-        return [
-            {
-                "entity_id": "mock_entity_1",
-                "anomaly_score": 0.95,
-                "anomaly_type": "unusual_transaction_pattern",
-                "description": "Mock anomaly detection result"
-            }
-        ]
-    
     try:
         from opencog.atomspace import types
         anomalies = []
         
-        # Get all atoms and analyze attention values
-        atoms = atomspace.get_atoms_by_type(types.Atom)
-        
-        for atom in atoms:
-            # Check attention value (STI - Short Term Importance)
-            sti = atom.asti
-            if sti > threshold:
-                anomalies.append({
-                    "atom_id": str(atom.h),
-                    "anomaly_score": sti,
-                    "anomaly_type": "high_attention",
-                    "description": f"Atom {str(atom)} has unusually high attention value"
-                })
-        
-        logger.debug(f"Detected {len(anomalies)} anomalies with threshold {threshold}")
+        # Only concept nodes (entities and values) carry attention worth reporting
+        atoms = atomspace.get_atoms_by_type(types.ConceptNode)
+        
+        # Check attention values (STI - Short Term Importance) in one pass. Reading
+        # asti from each atom is the dominant cost; the vectorised or compiled
+        # threshold comparison below only speeds up the cheaper second step.
+        sti = [atom.asti for atom in atoms]
+        if np is not None:
+            sti = np.asarray(sti, dtype=np.float64)
+        
+        for i in _indices_above(sti, threshold):
+            atom = atoms[i]
+            anomalies.append({
+                "atom_id": str(atom.h),
+                "anomaly_score": float(sti[i]),
+                "anomaly_type": "high_attention",
+                "description": f"Atom {atom.name} has unusually high attention value"
+            })
+        
+        logger.debug("Detected %d anomalies with threshold %s", len(anomalies), threshold)
         return anomalies
         
     except Exception as e:
@@ -314,16 +489,6 @@ def get_cognitive_insights(entity_id: str) -> Dict[str, Any]:
     """Get cognitive insights about entity behaviors."""
     global atomspace
     
-    if not opencog_available:
-        # Return mock insights
-        return {
-            "entity_id": entity_id,
-            "behavioral_patterns": ["mock_pattern_1", "mock_pattern_2"],
-            "cognitive_score": 0.8,
-            "attention_level": 0.6,
-            "relationship_count": 5
-        }
-    
     try:
         import opencog.type_constructors as tc
         
@@ -347,14 +512,10 @@ def get_cognitive_insights(entity_id: str) -> Dict[str, Any]:
         incoming = atomspace.get_incoming(entity_node)
         insights["relationship_count"] = len(incoming)
         
-        # Analyze behavioral patterns (simplified)
-        for link in incoming:
-            if hasattr(link, 'get_predicate'):
-                pred_name = str(link.get_predicate())
-                if "behavior" in pred_name.lower():
-                    insights["behavioral_patterns"].append(pred_name)
+        # Behavioral patterns are indexed as relationships are created
+        insights["behavioral_patterns"] = list(_behavior_index.get(entity_id, ()))
         
-        logger.debug(f"Generated cognitive insights for entity: {entity_id}")
+        logger.debug("Generated cognitive insights for entity: %s", entity_id)
         return insights
         
     except Exception as e:
@@ -362,16 +523,20 @@ def get_cognitive_insights(entity_id: str) -> Dict[str, Any]:
         raise
 
 
+def _reset_caches() -> None:
+    """Drop every Python-side cache that mirrors AtomSpace contents."""
+    _node_cache.clear()
+    _pattern_cache.clear()
+    _behavior_index.clear()
+
+
 def clear_atomspace():
     """Clear the AtomSpace and reset the cognitive state."""
     global atomspace
     
-    if not opencog_available:
-        logger.info("Mock AtomSpace cleared")
-        return
-    
     try:
         atomspace.clear()
+        _reset_caches()
         logger.info("AtomSpace cleared")
         
     except Exception as e:
@@ -386,9 +551,6 @@ def test_connection() -> str:
 
 def get_opencog_version() -> str:
     """Get OpenCog version information."""
-    if not opencog_available:
-        return "OpenCog not available (mock mode)"
-    
     try:
         # Try to get version info
         return "OpenCog 5.0.3 (via Python bridge)"
@@ -409,68 +571,240 @@ def shutdown():
             logger.error(f"Error during shutdown: {e}")
     
     atomspace = None
+    _reset_caches()
+
+
+# Mock implementations used when OpenCog is not available
+
+def _mock_initialize_atomspace():
+    """Mock counterpart of ``initialize_atomspace``."""
+    logger.info("Using mock AtomSpace initialization")
+    return "mock_atomspace_id"
+
+
+def _mock_create_concept_node(concept: str) -> str:
+    """Mock counterpart of ``create_concept_node``."""
+    return f"mock_concept_{concept}"
+
+
+def _mock_create_predicate_node(predicate: str) -> str:
+    """Mock counterpart of ``create_predicate_node``."""
+    return f"mock_predicate_{predicate}"
+
+
+def _mock_add_transaction_entity(entity_id: str, properties: Dict[str, Any]) -> str:
+    """Mock counterpart of ``add_transaction_entity``."""
+    return f"mock_entity_{entity_id}"
+
+
+def _mock_create_relationship(predicate: str, from_entity: str, to_entity: str, strength: float) -> str:
+    """Mock counterpart of ``create_relationship``."""
+    return f"mock_relationship_{predicate}_{from_entity}_{to_entity}"
+
+
+def _mock_add_transaction_entities(entities: List[Dict[str, Any]]) -> List[str]:
+    """Mock counterpart of ``add_transaction_entities``."""
+    return [f"mock_entity_{entity['entity_id']}" for entity in entities]
+
+
+def _mock_create_relationships(edges: List[Dict[str, Any]]) -> List[str]:
+    """Mock counterpart of ``create_relationships``."""
+    return [
+        f"mock_relationship_{edge['predicate']}_{edge['from_entity']}_{edge['to_entity']}"
+        for edge in edges
+    ]
+
+
+def _mock_execute_pattern_matching(pattern: str, count: bool = False) -> List[Dict[str, Any]]:
+    """Mock counterpart of ``execute_pattern_matching``."""
+    # Return mock results
+    return [
+        {
+            "pattern": pattern,
+            "matches": ["mock_match_1", "mock_match_2"],
+            "confidence": 0.85
+        }
+    ]
+
+
+def _mock_run_pln_inference(query: str, max_steps: int) -> List[Dict[str, Any]]:
+    """Mock counterpart of ``run_pln_inference``."""
+    # Return mock PLN results
+    return [
+        {
+            "query": query,
+            "inference_result": "mock_inference_result",
+            "confidence": 0.75,
+            "steps": min(max_steps, 5)
+        }
+    ]
+
+
+def _mock_detect_anomalies(threshold: float) -> List[Dict[str, Any]]:
+    """Mock counterpart of ``detect_anomalies``."""
+    # Return mock anomalies
+    return [
+        {
+            "entity_id": "mock_entity_1",
+            "anomaly_score": 0.95,
+            "anomaly_type": "unusual_transaction_pattern",
+            "description": "Mock anomaly detection result"
+        }
+    ]
+
+
+def _mock_get_cognitive_insights(entity_id: str) -> Dict[str, Any]:
+    """Mock counterpart of ``get_cognitive_insights``."""
+    # Return mock insights
+    return {
+        "entity_id": entity_id,
+        "behavioral_patterns": ["mock_pattern_1", "mock_pattern_2"],
+        "cognitive_score": 0.8,
+        "attention_level": 0.6,
+        "relationship_count": 5
+    }
+
+
+def _mock_clear_atomspace():
+    """Mock counterpart of ``clear_atomspace``."""
+    logger.info("Mock AtomSpace cleared")
+
+
+def _mock_get_opencog_version() -> str:
+    """Mock counterpart of ``get_opencog_version``."""
+    return "OpenCog not available (mock mode)"
+
+# Public bridge functions and their mock counterparts
+# Real and mock implementation of each bridge function, keyed by name
+_IMPLEMENTATIONS = {
+    "initialize_atomspace": (initialize_atomspace, _mock_initialize_atomspace),
+    "create_concept_node": (create_concept_node, _mock_create_concept_node),
+    "create_predicate_node": (create_predicate_node, _mock_create_predicate_node),
+    "add_transaction_entity": (add_transaction_entity, _mock_add_transaction_entity),
+    "create_relationship": (create_relationship, _mock_create_relationship),
+    "add_transaction_entities": (add_transaction_entities, _mock_add_transaction_entities),
+    "create_relationships": (create_relationships, _mock_create_relationships),
+    "execute_pattern_matching": (execute_pattern_matching, _mock_execute_pattern_matching),
+    "run_pln_inference": (run_pln_inference, _mock_run_pln_inference),
+    "detect_anomalies": (detect_anomalies, _mock_detect_anomalies),
+    "get_cognitive_insights": (get_cognitive_insights, _mock_get_cognitive_insights),
+    "clear_atomspace": (clear_atomspace, _mock_clear_atomspace),
+    "get_opencog_version": (get_opencog_version, _mock_get_opencog_version),
+}
+
+
+def _bind_implementations(use_opencog: bool) -> None:
+    """Point the public bridge functions at the real or mock implementations.
+    
+    Called from initialize_opencog() so the functions themselves never need to
+    check ``opencog_available``.
+    """
+    globals().update(
+        (name, real if use_opencog else mock)
+        for name, (real, mock) in _IMPLEMENTATIONS.items()
+    )
+
+
+# Mock mode until initialize_opencog() succeeds
+_bind_implementations(False)
+
+
+# Bridge functions keyed by name; each handler takes the request parameters dict.
+# Names are resolved at call time so handlers follow _bind_implementations().
+DISPATCH = {
+    "initialize_atomspace": lambda p: initialize_atomspace(),
+    "create_concept_node": lambda p: create_concept_node(p["concept"]),
+    "create_predicate_node": lambda p: create_predicate_node(p["predicate"]),
+    "add_transaction_entity": lambda p: add_transaction_entity(p["entity_id"], p["properties"]),
+    "add_transaction_entities": lambda p: add_transaction_entities(p["entities"]),
+    "create_relationship": lambda p: create_relationship(
+        p["predicate"], p["from_entity"], p["to_entity"], p["strength"]
+    ),
+    "create_relationships": lambda p: create_relationships(p["edges"]),
+    "execute_pattern_matching": lambda p: execute_pattern_matching(
+        p["pattern"], p.get("count", False)
+    ),
+    "run_pln_inference": lambda p: run_pln_inference(p["query"], p["max_steps"]),
+    "detect_anomalies": lambda p: detect_anomalies(p["threshold"]),
+    "get_cognitive_insights": lambda p: get_cognitive_insights(p["entity_id"]),
+    "clear_atomspace": lambda p: clear_atomspace() or "cleared",
+    "test_connection": lambda p: test_connection(),
+    "get_opencog_version": lambda p: get_opencog_version(),
+    "shutdown": lambda p: shutdown() or "shutdown",
+}
+
+
+def dispatch(function_name: str, parameters: Dict[str, Any]) -> Any:
+    """Invoke the bridge function registered under ``function_name``."""
+    handler = DISPATCH.get(function_name)
+    if handler is None:
+        raise ValueError(f"Unknown function: {function_name}")
+    return handler(parameters)
+
+
+def serve():
+    """Run the bridge as a long-lived daemon.
+
+    Reads newline-delimited JSON requests of the form
+    ``{"id": ..., "fn": ..., "args": {...}}`` from stdin and writes one JSON
+    response per line to stdout, keeping the AtomSpace resident across calls.
+    """
+    initialize_opencog()
+    
+    # Frames are read and written as raw bytes, skipping text decoding
+    out = sys.stdout.buffer
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+        
+        request_id = None
+        function_name = None
+        try:
+            req = _loads(line)
+            request_id = req.get("id")
+            function_name = req["fn"]
+            result = dispatch(function_name, req.get("args") or {})
+            # Serialised here so an unencodable result is reported, not fatal
+            frame = _dumpb({"id": request_id, "result": result})
+        except Exception as e:
+            logger.error(f"Error executing function {function_name}: {e}")
+            logger.error(traceback.format_exc())
+            frame = _dumpb({"id": request_id, "error": str(e)})
+        
+        out.write(frame + b"\n")
+        out.flush()
+        
+        if function_name == "shutdown":
+            break
 
 
 def main():
-    """Main entry point for the Python bridge."""
+    """Single-shot CLI entry point for the Python bridge."""
     if len(sys.argv) != 3:
-        print("Usage: opencog_bridge.py <function_name> <parameters_json>")
+        print("Usage: opencog_bridge.py --serve | <function_name> <parameters_json>")
         sys.exit(1)
     
     function_name = sys.argv[1]
     parameters_json = sys.argv[2]
     
     try:
-        # Initialize OpenCog on first run
-        if atomspace is None:
-            initialize_opencog()
+        initialize_opencog()
         
         # Parse parameters
-        parameters = json.loads(parameters_json) if parameters_json != "null" else {}
-        
-        # Execute the requested function
-        if function_name == "initialize_atomspace":
-            result = initialize_atomspace()
-        elif function_name == "create_concept_node":
-            result = create_concept_node(parameters["concept"])
-        elif function_name == "create_predicate_node":
-            result = create_predicate_node(parameters["predicate"])
-        elif function_name == "add_transaction_entity":
-            result = add_transaction_entity(parameters["entity_id"], parameters["properties"])
-        elif function_name == "create_relationship":
-            result = create_relationship(
-                parameters["predicate"], 
-                parameters["from_entity"], 
-                parameters["to_entity"], 
-                parameters["strength"]
-            )
-        elif function_name == "execute_pattern_matching":
-            result = execute_pattern_matching(parameters["pattern"])
-        elif function_name == "run_pln_inference":
-            result = run_pln_inference(parameters["query"], parameters["max_steps"])
-        elif function_name == "detect_anomalies":
-            result = detect_anomalies(parameters["threshold"])
-        elif function_name == "get_cognitive_insights":
-            result = get_cognitive_insights(parameters["entity_id"])
-        elif function_name == "clear_atomspace":
-            clear_atomspace()
-            result = "cleared"
-        elif function_name == "test_connection":
-            result = test_connection()
-        elif function_name == "get_opencog_version":
-            result = get_opencog_version()
-        elif function_name == "shutdown":
-            shutdown()
-            result = "shutdown"
-        else:
-            raise ValueError(f"Unknown function: {function_name}")
+        parameters = _loads(parameters_json) if parameters_json != "null" else {}
+        
+        result = dispatch(function_name, parameters)
         
         # Output result
         if result is not None:
+            out = sys.stdout.buffer
             if isinstance(result, (dict, list)):
-                print(json.dumps(result))
+                out.write(_dumpb(result))
             else:
-                print(str(result))
+                out.write(str(result).encode())
+            out.write(b"\n")
+            out.flush()
         
     except Exception as e:
         logger.error(f"Error executing function {function_name}: {e}")
@@ -479,4 +813,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:] == ["--serve"]:
+        serve()
+    else:
+        main()
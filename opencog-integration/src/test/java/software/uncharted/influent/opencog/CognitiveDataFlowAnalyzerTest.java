@@ -2,6 +2,10 @@ package software.uncharted.influent.opencog;
 
 import static org.junit.Assert.*;
 
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
 import org.junit.After;
 import org.junit.Before;
 import org.junit.Test;
@@ -44,4 +48,59 @@ public class CognitiveDataFlowAnalyzerTest {
     assertNotNull("Concept ID should not be null", conceptId);
     assertTrue("Concept ID should not be empty", !conceptId.isEmpty());
   }
+
+  @Test
+  public void testBatchedEntityIngestion() {
+    // A repeated id is sent again rather than overwriting the earlier entry
+    String[] entityIds = {"acct_3", "acct_1", "acct_2", "acct_1"};
+
+    List<Map<String, Object>> entities = new ArrayList<>();
+    for (String entityId : entityIds) {
+      Map<String, Object> properties = new HashMap<>();
+      properties.put("type", "account");
+      properties.put("status", "active");
+
+      Map<String, Object> entity = new HashMap<>();
+      entity.put("entity_id", entityId);
+      entity.put("properties", properties);
+      entities.add(entity);
+    }
+
+    List<String> atomIds = atomSpaceBridge.addTransactionEntities(entities);
+
+    assertEquals("One atom ID per entity", entityIds.length, atomIds.size());
+    for (int i = 0; i < entities.size(); i++) {
+      @SuppressWarnings("unchecked")
+      Map<String, Object> properties = (Map<String, Object>) entities.get(i).get("properties");
+      assertEquals(
+          "Atom IDs should follow entity order",
+          atomSpaceBridge.addTransactionEntity(entityIds[i], properties),
+          atomIds.get(i));
+    }
+  }
+
+  @Test
+  public void testBatchedRelationshipCreation() {
+    String[][] edges = {{"acct_1", "acct_2"}, {"acct_2", "acct_3"}, {"acct_3", "acct_1"}};
+
+    List<Map<String, Object>> relationships = new ArrayList<>();
+    for (String[] edge : edges) {
+      Map<String, Object> relationship = new HashMap<>();
+      relationship.put("predicate", "transacts_with");
+      relationship.put("from_entity", edge[0]);
+      relationship.put("to_entity", edge[1]);
+      relationship.put("strength", 0.5);
+      relationships.add(relationship);
+    }
+
+    List<String> linkIds = atomSpaceBridge.createRelationships(relationships);
+
+    assertEquals("One link ID per relationship", edges.length, linkIds.size());
+    for (int i = 0; i < edges.length; i++) {
+      assertEquals(
+          "Link IDs should follow relationship order",
+          atomSpaceBridge.createRelationship("transacts_with", edges[i][0], edges[i][1], 0.5),
+          linkIds.get(i));
+    }
+  }
 }
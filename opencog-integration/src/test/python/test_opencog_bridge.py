@@ -0,0 +1,306 @@
+"""
+Tests for the OpenCog bridge against a minimal in-memory stand-in for the
+``opencog`` Python bindings.
+"""
+
+import importlib
+import io
+import itertools
+import json
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "main", "python"))
+
+
+class StubAtom:
+    """Atom with the attributes the bridge reads."""
+
+    _handles = itertools.count(1)
+
+    def __init__(self, type_name, name=None, out=()):
+        self.type_name = type_name
+        self.name = name
+        self.out = list(out)
+        self.h = next(self._handles)
+        self.asti = 0.0
+        self.tv = types.SimpleNamespace(mean=0.0)
+
+
+class StubAtomSpace:
+    """AtomSpace that deduplicates atoms by type, name and outgoing set."""
+
+    def __init__(self):
+        self.atoms = {}
+
+    def add(self, type_name, name=None, out=()):
+        key = (type_name, name, tuple(atom.h for atom in out))
+        atom = self.atoms.get(key)
+        if atom is None:
+            atom = self.atoms[key] = StubAtom(type_name, name, out)
+        return atom
+
+    def get_atoms_by_type(self, type_name):
+        if type_name == "Node":
+            return [atom for atom in self.atoms.values() if atom.name is not None]
+        return [atom for atom in self.atoms.values() if atom.type_name == type_name]
+
+    def get_incoming(self, atom):
+        return [link for link in self.atoms.values() if atom in link.out]
+
+    def clear(self):
+        self.atoms.clear()
+
+    def __contains__(self, atom):
+        return atom in self.atoms.values()
+
+
+def _stub_opencog_modules():
+    """Build the ``opencog`` modules imported by the bridge."""
+    default = {}
+
+    def node(type_name):
+        return lambda name: default["space"].add(type_name, name=name)
+
+    def link(type_name):
+        return lambda *out: default["space"].add(type_name, out=out)
+
+    atomspace = types.ModuleType("opencog.atomspace")
+    atomspace.AtomSpace = StubAtomSpace
+    atomspace.TruthValue = lambda strength, confidence: (strength, confidence)
+    atomspace.types = types.SimpleNamespace(
+        Atom="Atom", Node="Node", ConceptNode="ConceptNode", EvaluationLink="EvaluationLink"
+    )
+
+    tc = types.ModuleType("opencog.type_constructors")
+    for name in ("ConceptNode", "PredicateNode", "VariableNode", "TypeNode"):
+        setattr(tc, name, node(name))
+    for name in ("EvaluationLink", "ListLink", "GetLink", "VariableList", "TypedVariableLink"):
+        setattr(tc, name, link(name))
+
+    utilities = types.ModuleType("opencog.utilities")
+    utilities.initialize_opencog = lambda space: default.update(space=space)
+
+    def execute_atom(space, query):
+        # GetLink(VariableList, EvaluationLink(PredicateNode, ListLink($x, $y)))
+        predicate = query.out[1].out[0]
+        groundings = [
+            StubAtom("ListLink", out=atom.out[1].out)
+            for atom in space.get_atoms_by_type("EvaluationLink")
+            if atom.out[0] is predicate
+            and all(arg.type_name == "ConceptNode" for arg in atom.out[1].out)
+        ]
+        return StubAtom("SetLink", out=groundings)
+
+    bindlink = types.ModuleType("opencog.bindlink")
+    bindlink.execute_atom = execute_atom
+
+    return {
+        "opencog": types.ModuleType("opencog"),
+        "opencog.atomspace": atomspace,
+        "opencog.type_constructors": tc,
+        "opencog.utilities": utilities,
+        "opencog.bindlink": bindlink,
+    }
+
+
+class TestOpenCogBridge(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(sys.modules, _stub_opencog_modules())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        sys.modules.pop("opencog_bridge", None)
+        self.bridge = importlib.import_module("opencog_bridge")
+        self.assertTrue(self.bridge.initialize_opencog())
+
+    def call(self, function_name, **parameters):
+        return self.bridge.dispatch(function_name, parameters)
+
+    def test_pattern_matching_empty_atomspace_has_no_matches(self):
+        self.assertEqual(self.call("execute_pattern_matching", pattern="fraud"), [])
+        self.assertEqual(self.call("execute_pattern_matching", pattern="x"), [])
+
+    def test_pattern_matching_returns_predicate_groundings(self):
+        self.call("create_relationship", predicate="fraud", from_entity="a",
+                  to_entity="b", strength=0.5)
+        a = self.call("create_concept_node", concept="a")
+        b = self.call("create_concept_node", concept="b")
+
+        results = self.call("execute_pattern_matching", pattern="fraud")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["matches"], [a, b])
+
+    def test_pattern_matching_reports_fan_out_entities_once(self):
+        for target in ("b", "c", "a"):
+            self.call("create_relationship", predicate="p", from_entity="a",
+                      to_entity=target, strength=0.5)
+        a, b, c = (self.call("create_concept_node", concept=name) for name in "abc")
+
+        results = self.call("execute_pattern_matching", pattern="p")
+
+        self.assertEqual(results[0]["matches"], [a, b, c])
+
+    def test_pattern_matching_falls_back_to_concept_names(self):
+        hub = self.call("create_concept_node", concept="high_connectivity_hub")
+
+        results = self.call("execute_pattern_matching", pattern="connectivity")
+
+        self.assertEqual(results[0]["matches"], [hub])
+
+    def test_module_functions_are_bound_to_real_implementations(self):
+        for name, (real, _) in self.bridge._IMPLEMENTATIONS.items():
+            self.assertIs(getattr(self.bridge, name), real)
+
+    def test_serve_reports_unserialisable_result_and_keeps_running(self):
+        requests = b"".join(
+            json.dumps(req).encode() + b"\n"
+            for req in (
+                {"id": 1, "fn": "get_opencog_version", "args": {}},
+                {"id": 2, "fn": "test_connection", "args": {}},
+                {"id": 3, "fn": "shutdown", "args": {}},
+            )
+        )
+        stdin = io.TextIOWrapper(io.BytesIO(requests))
+        stdout = io.TextIOWrapper(io.BytesIO())
+        implementations = dict(
+            self.bridge._IMPLEMENTATIONS,
+            get_opencog_version=(object, self.bridge._mock_get_opencog_version),
+        )
+
+        with mock.patch.object(self.bridge, "_IMPLEMENTATIONS", implementations), \
+                mock.patch.object(sys, "stdin", stdin), mock.patch.object(sys, "stdout", stdout):
+            self.bridge.serve()
+
+        responses = [json.loads(line) for line in stdout.buffer.getvalue().splitlines()]
+        self.assertEqual([response["id"] for response in responses], [1, 2, 3])
+        self.assertIn("error", responses[0])
+        self.assertEqual(responses[1]["result"], "OK")
+        self.assertEqual(responses[2]["result"], "shutdown")
+
+    def test_detect_anomalies_reports_atoms_above_threshold(self):
+        hot = self.call("create_concept_node", concept="hot")
+        self.call("create_concept_node", concept="cold")
+        for atom in self.bridge.atomspace.get_atoms_by_type("ConceptNode"):
+            if str(atom.h) == hot:
+                atom.asti = 5.0
+
+        anomalies = self.call("detect_anomalies", threshold=1.0)
+
+        self.assertEqual([anomaly["atom_id"] for anomaly in anomalies], [hot])
+        self.assertEqual(anomalies[0]["anomaly_score"], 5.0)
+
+    def test_node_cache_evicts_least_recently_used(self):
+        with mock.patch.object(self.bridge, "NODE_CACHE_SIZE", 2):
+            a = self.call("create_concept_node", concept="a")
+            self.call("create_concept_node", concept="b")
+            self.call("create_concept_node", concept="a")
+            self.call("add_transaction_entity", entity_id="t1", properties={"amount": 12.5})
+
+        self.assertEqual(
+            list(self.bridge._node_cache),
+            [("PredicateNode", "has_amount"), ("ConceptNode", "12.5")],
+        )
+        self.assertEqual(self.call("create_concept_node", concept="a"), a)
+
+    def test_insights_list_behavior_predicates_once_for_both_endpoints(self):
+        for _ in range(2):
+            self.call("create_relationships", edges=[
+                {"predicate": "spending_behavior", "from_entity": "a", "to_entity": "b",
+                 "strength": 0.5},
+                {"predicate": "transfer", "from_entity": "a", "to_entity": "b", "strength": 0.5},
+            ])
+        self.call("create_relationship", predicate="login_behavior", from_entity="c",
+                  to_entity="a", strength=0.5)
+
+        a = self.call("get_cognitive_insights", entity_id="a")
+        b = self.call("get_cognitive_insights", entity_id="b")
+
+        self.assertEqual(a["behavioral_patterns"], ["spending_behavior", "login_behavior"])
+        self.assertEqual(b["behavioral_patterns"], ["spending_behavior"])
+
+    def test_pattern_queries_are_reused_bounded_and_cleared(self):
+        build = mock.Mock(wraps=self.bridge._build_get_link)
+        with mock.patch.object(self.bridge, "_build_get_link", build), \
+                mock.patch.object(self.bridge, "PATTERN_CACHE_SIZE", 2):
+            for pattern in ("p", "q", "p", "r", "p"):
+                self.call("execute_pattern_matching", pattern=pattern)
+
+            self.assertEqual([c.args[0] for c in build.call_args_list], ["p", "q", "r"])
+            self.assertEqual(list(self.bridge._pattern_cache), ["r", "p"])
+
+            self.call("clear_atomspace")
+            self.assertEqual(list(self.bridge._pattern_cache), [])
+
+            self.call("execute_pattern_matching", pattern="p")
+            self.assertEqual(build.call_count, 4)
+
+    def test_pattern_matching_caps_matches_unless_counting(self):
+        limit = self.bridge.MAX_PATTERN_MATCHES
+        hubs = [self.call("create_concept_node", concept=f"hub_{i}") for i in range(limit + 5)]
+
+        scanned = []
+        iter_name_matches = self.bridge._iter_name_matches
+
+        def recording_iter(atoms, pattern_lower):
+            return iter_name_matches((scanned.append(atom) or atom for atom in atoms),
+                                     pattern_lower)
+
+        with mock.patch.object(self.bridge, "_iter_name_matches", recording_iter):
+            capped = self.call("execute_pattern_matching", pattern="hub")
+            self.assertEqual(len(scanned), limit)
+
+            counted = self.call("execute_pattern_matching", pattern="hub", count=True)
+
+        self.assertEqual(capped[0]["matches"], hubs[:limit])
+        self.assertNotIn("count", capped[0])
+        self.assertEqual(counted[0]["matches"], hubs[:limit])
+        self.assertEqual(counted[0]["count"], limit + 5)
+
+
+class TestOpenCogBridgeWithoutNumPy(TestOpenCogBridge):
+    """Runs the same tests with the NumPy and Numba imports unavailable."""
+
+    def setUp(self):
+        patcher = mock.patch.dict(sys.modules, {"numpy": None, "numba": None})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+        self.assertIsNone(self.bridge.np)
+
+
+class TestOpenCogBridgeMockMode(unittest.TestCase):
+    def setUp(self):
+        # A None entry makes ``import opencog`` raise ImportError
+        patcher = mock.patch.dict(sys.modules, {"opencog": None})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        sys.modules.pop("opencog_bridge", None)
+        self.bridge = importlib.import_module("opencog_bridge")
+        self.assertFalse(self.bridge.initialize_opencog())
+
+    def test_dispatch_uses_mock_implementations(self):
+        result = self.bridge.dispatch("create_concept_node", {"concept": "a"})
+
+        self.assertEqual(result, self.bridge._mock_create_concept_node("a"))
+        self.assertEqual(
+            self.bridge.dispatch("get_opencog_version", {}),
+            self.bridge._mock_get_opencog_version(),
+        )
+
+    def test_module_functions_return_mock_data(self):
+        self.assertEqual(
+            self.bridge.create_concept_node("a"), self.bridge._mock_create_concept_node("a")
+        )
+        self.assertEqual(
+            self.bridge.detect_anomalies(0.1), self.bridge._mock_detect_anomalies(0.1)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()